@@ -1,5 +1,6 @@
 import sec
 import time
+import utils
 import logging
 import datetime
 import fundamentals
@@ -67,7 +68,7 @@ class Filings(fundamentals.Fundamentals):
     def update(self):
 
         # Initializing downloader class to download filings date from SEC
-        sec_engine = sec.SEC()
+        sec_engine = sec.SEC(user_agent=utils.sec_user_agent)
 
         # Iterating over the consolidated filings on stockpup website
         for ticker, records_to_store in self._yield_records():
@@ -1,24 +1,46 @@
 import re
-import pprint
+import time
+import utils
+import socket
 import logging
 import calendar
 import datetime
+import threading
 import numpy as np
 import pandas as pd
 from bs4 import BeautifulSoup
-from urllib.request import urlopen
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+
+# Result of parsing one filer's 13F-HR. When fetching or parsing fails, error holds the reason, holdings is None and
+# filing_date is set if the failure happened after the filing was found. When the filer has no filing for the
+# requested quarter, both holdings and error are None and filing_date holds the last filing seen.
+FilerHoldings = namedtuple('FilerHoldings', ['cik', 'filing_date', 'holdings', 'error'])
+
+
+class FilingParseError(Exception):
+    """
+    Raised when a filing was found on EDGAR but could not be fetched or parsed, so that callers still know which
+    filing the failure belongs to.
+    """
+    def __init__(self, filing_date, error):
+        super(FilingParseError, self).__init__('%s: %s' % (type(error).__name__, error))
+        self.filing_date = filing_date
 
 
 class SEC:
     """
     This class is a parser which parses data from the SEC Edgar filings site. It is used primarily for
-    1) Replicating 13F portfolios from investment gurus
+    1) Replicating 13F portfolios from investment gurus, or parsing the 13F of every filer in a given universe
     2) Finding dates for filings by companies
 
     In particular to point 2, it is used in conjunction with my Filings class. See comments in my Filings class
     to understand the rationale of a separate class for SEC filings.
     """
-    def __init__(self):
+    def __init__(self, user_agent=None):
 
         # Setup logger
         self.logger = logging.getLogger('sec')
@@ -35,6 +57,19 @@ class SEC:
         self._doc_start_idx = '&start='
         self._max_doc_to_show = '100'
 
+        # Define request settings. SEC allows at most 10 requests per second from one host and rejects requests
+        # without a user agent identifying the requester, so all requests go through _open which paces them a
+        # little below the limit and retries transient failures a bounded number of times.
+        self._user_agent = user_agent
+        self._timeout = 10
+        self._requests_per_second = 8
+        self._max_retries = 3
+        self._retry_backoff = 2.
+        self._retry_http_codes = [429, 500, 502, 503, 504]
+        self._throttle_cooldown = 600.
+        self._rate_lock = threading.Lock()
+        self._next_request_time = 0.
+
         # Define details for 13F which we want to replicate
         self.gurus_to_replicate = {'Greenblatt': '0001510387', 'Munger': '0000783412', 'Simpson': '0001534380',
                                    'Yacktman': '0000905567', 'Ackman': '0001336528', 'Buffet': '0001067983',
@@ -44,11 +79,63 @@ class SEC:
 
         # Define utils to ease parsing of data
         self.before_date_fmt = '%Y%m%d'
-        self.data_store_for_13F = None
+        self.filers_progress_step = 100
+
+    @staticmethod
+    def _new_data_store():
+        return {'date': [], 'security': [], 'cusip': [], 'title': [], 'qty': [], 'value': [],
+                'opt_type': [], 'sec_type': [], 'voting_auth': []}
+
+    def _open(self, url):
+        headers = {} if self._user_agent is None else {'User-Agent': self._user_agent}
+        for attempt in range(self._max_retries + 1):
+
+            # Spacing requests out evenly across all threads so that we never exceed the SEC rate limit
+            with self._rate_lock:
+                wait = self._next_request_time - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                self._next_request_time = time.monotonic() + 1. / self._requests_per_second
+
+            # Reading within the retry loop so that a timeout while reading the body is retried as well
+            try:
+                return urlopen(Request(url, headers=headers), timeout=self._timeout).read()
+            except HTTPError as e:
+                if e.code not in self._retry_http_codes or attempt == self._max_retries:
+                    raise
+
+                # After a 429, SEC blocks the host for a while, so every worker has to wait rather than just this
+                # one. Pushing back the next request time under the lock pauses all of them together.
+                if e.code == 429:
+                    cooldown = self._get_retry_after(e)
+                    self.logger.warning('Throttled by SEC, pausing all requests for %.0f seconds...' % cooldown)
+                    with self._rate_lock:
+                        self._next_request_time = max(self._next_request_time, time.monotonic() + cooldown)
+                    continue
+                reason = 'HTTP %d' % e.code
+            except (URLError, socket.timeout, ConnectionError) as e:
+                if attempt == self._max_retries:
+                    raise
+                reason = str(e)
+
+            backoff = self._retry_backoff * 2 ** attempt
+            self.logger.debug('Retrying %s in %.0f seconds after %s...' % (url, backoff, reason))
+            time.sleep(backoff)
+
+    def _get_retry_after(self, error):
 
-    def _reset_data_store(self):
-        self.data_store_for_13F = {'date': [], 'security': [], 'cusip': [], 'title': [], 'qty': [], 'value': [],
-                                   'opt_type': [], 'sec_type': [], 'voting_auth': []}
+        # Retry-After may also be given as a HTTP date, in which case the fixed cooldown is used instead
+        try:
+            return max(float(error.headers.get('Retry-After')), 1. / self._requests_per_second)
+        except (AttributeError, TypeError, ValueError):
+            return self._throttle_cooldown
+
+    def _check_user_agent(self):
+
+        # SEC rejects requests without a user agent, which would otherwise turn into an error for every request
+        if self._user_agent is None:
+            raise ValueError('SEC requires a user agent with contact details, e.g. "Name email@example.com". '
+                             'Please provide one when creating the SEC class.')
 
     def update(self, doc_type, before_date='', ciks=None):
 
@@ -57,7 +144,7 @@ class SEC:
             if ciks is not None:
                 raise ValueError('Using a document type of 13F-HR only makes sense for gurus data, and ' +
                                  'not the CIKs you have chosen. Please ignore the CIKs argument if you ' +
-                                 'wish to parse only gurus data.')
+                                 'wish to parse only gurus data, or use update_filers for other filers.')
             else:
                 ciks_to_use = self.gurus_to_replicate
         else:
@@ -66,25 +153,21 @@ class SEC:
             else:
                 ciks_to_use = ciks
 
-        # Error checking to ensure correct format of before_date was given
-        if isinstance(before_date, str):
-            if before_date != '':
-                try:
-                    _ = datetime.datetime.strptime(before_date, self.before_date_fmt)
-                except ValueError as e:
-                    self.logger.error('Your date was not provided in the format %s' % self.before_date_fmt)
-                    exit()
-            else:
-                self.logger.info('Parsing the latest file...')
-        else:
-            raise TypeError('before_date should be a string with format %s.' % self.before_date_fmt)
+        # Error checking to ensure a user agent and correct format of before_date were given
+        self._check_user_agent()
+        self._check_date(before_date, 'before_date')
+        if before_date == '':
+            self.logger.info('Parsing the latest file...')
 
         # Looping over ciks to parse data for
         for name, cik in ciks_to_use.items():
             self.logger.info('Parsing data for ' + name + '...')
-            self._reset_data_store()
 
-            filing_date, holdings = self._update(doc_type, before_date, cik)
+            try:
+                filing_date, holdings = self._update(doc_type, before_date, cik, self._get_last_ended_qtr_date())
+            except FilingParseError as e:
+                self.logger.warning('Failed to parse documents for %s filed on %s: %s' % (name, e.filing_date, e))
+                continue
 
             if holdings is None:
                 if doc_type == '13F-HR':
@@ -97,11 +180,105 @@ class SEC:
                     sub_hldgs = holdings.iloc[:self.top_rank_to_use[name], :]
                     sub_hldgs.loc[:, 'PctHldg'] = sub_hldgs.loc[:, 'value'] / sub_hldgs.sum()['value']
                     sub_hldgs = sub_hldgs.sort_values(by='PctHldg', ascending=False)
-                    print(name, cik, filing_date)
-                    pprint.pprint(sub_hldgs)
+                    self.logger.info('Top holdings of %s (%s) filed on %s:\n%s' % (name, cik, filing_date, sub_hldgs))
                 else:
                     return filing_date
 
+    def update_filers(self, ciks, quarter_end='', max_workers=8):
+        """
+        Parses the 13F-HR of every given filer concurrently and returns a dict of FilerHoldings keyed by CIK.
+        If quarter_end is given in before_date_fmt, the filing for that quarter is parsed, otherwise the latest
+        filing is parsed regardless of when it was filed. Failures are logged and recorded per filer instead of
+        stopping the whole refresh. Since every filer takes about 3 requests and _open caps the request rate,
+        a refresh takes roughly 0.4 seconds per filer once there are enough workers to saturate the limit, plus
+        whatever retries the filers need.
+        """
+
+        # Error checking to ensure a user agent and correct format of quarter_end were given
+        self._check_user_agent()
+        self._check_date(quarter_end, 'quarter_end')
+        if quarter_end == '':
+            before_date, min_filing_date, period = '', None, None
+        else:
+            min_filing_date = datetime.datetime.strptime(quarter_end, self.before_date_fmt).date()
+            if min_filing_date != self._get_qtr_end_date(min_filing_date):
+                raise ValueError('quarter_end should be the last day of a quarter, e.g. %s.' %
+                                 self._get_qtr_end_date(min_filing_date).strftime(self.before_date_fmt))
+
+            # A filing for a quarter must be made after the quarter has ended, and is due well before the next
+            # quarter ends, so the last filing before the next quarter end should be the one for this quarter.
+            # Late filings for earlier quarters can still show up here, so filings are walked until the period of
+            # report matches.
+            before_date = self._get_next_qtr_date(min_filing_date).strftime(self.before_date_fmt)
+            period = quarter_end
+
+        ciks = list(dict.fromkeys(str(cik).zfill(10) for cik in ciks))
+        self.logger.info('Parsing 13F-HR for %d filers with %d workers...' % (len(ciks), max_workers))
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._update_filer, cik, before_date, min_filing_date, period) for cik in ciks
+            ]
+            try:
+                for future in as_completed(futures):
+                    result = future.result()
+                    results[result.cik] = result
+                    if result.error is not None:
+                        self.logger.warning('Failed to parse 13F-HR for %s: %s' % (result.cik, result.error))
+
+                    if len(results) % self.filers_progress_step == 0 or len(results) == len(futures):
+                        self.logger.info('Parsed %d of %d filers...' % (len(results), len(futures)))
+            except KeyboardInterrupt:
+
+                # Cancelling queued filers so that only those already running need to finish before exiting
+                self.logger.warning('Interrupted after %d of %d filers, cancelling the rest...' %
+                                    (len(results), len(futures)))
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        n_errors = sum(result.error is not None for result in results.values())
+        self.logger.info('13F-HR updates are complete with %d errors.' % n_errors)
+        return results
+
+    def _update_filer(self, cik, before_date, min_filing_date, period):
+        try:
+            parsed = self._update('13F-HR', before_date, cik, min_filing_date, period)
+        except FilingParseError as e:
+            return FilerHoldings(cik, e.filing_date, None, str(e))
+        except Exception as e:
+            return FilerHoldings(cik, None, None, '%s: %s' % (type(e).__name__, e))
+
+        if parsed is None:
+            return FilerHoldings(cik, None, None, 'No 13F-HR filing found')
+
+        # Parse failures are raised by _update, so holdings being None means there is no filing for the quarter
+        filing_date, holdings = parsed
+        return FilerHoldings(cik, filing_date, holdings, None)
+
+    def _check_date(self, date, arg_name):
+        if not isinstance(date, str):
+            raise TypeError('%s should be a string with format %s.' % (arg_name, self.before_date_fmt))
+        if date != '':
+            try:
+                _ = datetime.datetime.strptime(date, self.before_date_fmt)
+            except ValueError:
+                raise ValueError('Your date was not provided in the format %s' % self.before_date_fmt)
+
+    @staticmethod
+    def _get_qtr_end_date(date):
+        qtr_mth = (date.month - 1) // 3 * 3 + 3
+        qtr_last_day = calendar.monthrange(date.year, qtr_mth)[1]
+        return datetime.date(year=date.year, month=qtr_mth, day=qtr_last_day)
+
+    @staticmethod
+    def _get_next_qtr_date(qtr_date):
+        qtr_mth = (qtr_date.month - 1) // 3 * 3 + 6
+        qtr_year = qtr_date.year + 1 if qtr_mth > 12 else qtr_date.year
+        qtr_mth = qtr_mth - 12 if qtr_mth > 12 else qtr_mth
+        qtr_last_day = calendar.monthrange(qtr_year, qtr_mth)[1]
+        return datetime.date(year=qtr_year, month=qtr_mth, day=qtr_last_day)
+
     @staticmethod
     def _get_last_ended_qtr_date():
         today = datetime.datetime.today()
@@ -111,7 +288,7 @@ class SEC:
         qtr_last_day = calendar.monthrange(qtr_year, qtr_mth)[1]
         return datetime.date(year=qtr_year, month=qtr_mth, day=qtr_last_day)
 
-    def _update(self, doc_type, before_date, cik):
+    def _update(self, doc_type, before_date, cik, min_filing_date, period=None):
 
         # Determining URL based on document type since URL structure for 13F vs 10-K/10-Q is different
         if doc_type == '13F-HR':
@@ -122,12 +299,12 @@ class SEC:
                   self._before_date + before_date + self._ownership + self._doc_count + self._max_doc_to_show
 
         # Opening the site and parsing the XML data
-        soup = BeautifulSoup(urlopen(url), 'html.parser')
+        soup = BeautifulSoup(self._open(url), 'html.parser')
         tr_tags = soup.find_all('tr')
+        last_filing_date_str = None
         for tr_tag in tr_tags:
             tr_tag_contents = tr_tag.contents
             for tr_tag_content in tr_tag_contents:
-                print(tr_tag_content)
                 if tr_tag_content.string == doc_type:
                     if doc_type == '13F-HR':
                         documents_link = self._url_head + tr_tag_contents[3].a.get('href')
@@ -143,72 +320,98 @@ class SEC:
                     filing_date_str = str(filing_date.encode('utf-8'))[2:12]
                     reformatted_filing_date = datetime.datetime.strptime(filing_date_str, '%Y-%m-%d').date()
 
-                    # If latest filing date is smaller than last ended quarter date, we probably already acted
-                    # on this information previously. The latest filing is always after the last ended quarter date.
-                    if reformatted_filing_date < self._get_last_ended_qtr_date():
+                    # If latest filing date is smaller than min_filing_date, which is usually the last ended
+                    # quarter date, we probably already acted on this information previously. The latest filing is
+                    # always after the last ended quarter date. None means any filing date is accepted.
+                    if min_filing_date is not None and reformatted_filing_date < min_filing_date:
                         return filing_date_str, None
 
                     if doc_type == '13F-HR':
-                        return filing_date_str, self._parse_13F(documents_link)
+
+                        # Any failure from here on is tied to this filing, so its date is passed on with the error.
+                        # Filings for other periods are skipped, e.g. a late filing for an earlier quarter.
+                        try:
+                            contents = self._get_13F_contents(documents_link)
+                            if period is not None and self._get_report_date(contents) != period:
+                                last_filing_date_str = filing_date_str
+                                break
+                            return filing_date_str, self._parse_13F(contents)
+                        except Exception as e:
+                            raise FilingParseError(filing_date_str, e) from e
                     else:
                         return filing_date_str, self._parse_10K10Q(documents_link)
 
+        # Only reached when all filings that were recent enough are for other periods
+        if last_filing_date_str is not None:
+            return last_filing_date_str, None
+
     def _parse_10K10Q(self, link):
-        soup = BeautifulSoup(urlopen(link), 'html.parser')
+        soup = BeautifulSoup(self._open(link), 'html.parser')
         for a_tag in soup.find_all('a'):
             linkInTag = a_tag.get('href')
             if '.xlsx' in linkInTag:
                 return pd.read_excel(self._url_head + linkInTag, sheetname=None)
 
-    def _parse_13F(self, link):
-        soup = BeautifulSoup(urlopen(link), 'html.parser')
+    def _get_13F_contents(self, link):
+        soup = BeautifulSoup(self._open(link), 'html.parser')
         for a_tag in soup.find_all('a'):
             linkInTag = a_tag.get('href')
-            if '.txt' in linkInTag:
-                contents = urlopen(self._url_head + linkInTag).read().decode('utf-8')
-                report_date = contents.split('PERIOD OF REPORT:\t', 1)[1].split('\n')[0]
-                new_lines = [line.replace('&amp;', '&') for line in contents.split('\n')]
-                parsed_data = self._parse_new_fmt(report_date, new_lines)
-
-                # This part where the old format is used has not been error-checked. Need to find a file with
-                # the old format in order to check this.
-                if parsed_data.empty:
-                    print('This txt file follows the old format. Parsing with old format function instead...')
-                    old_fmt_data = self._parse_old_fmt(new_lines)
-                    for i in range(0, len(old_fmt_data) // 6):
-                        self.data_store_for_13F['security'].append(old_fmt_data[6 * i])
-                        self.data_store_for_13F['sec_type'].append(old_fmt_data[6 * i + 1])
-                        self.data_store_for_13F['cusip'].append(old_fmt_data[6 * i + 2])
-                        self.data_store_for_13F['value'].append(old_fmt_data[6 * i + 3])
-                        self.data_store_for_13F['qty'].append(old_fmt_data[6 * i + 4])
-                        self.data_store_for_13F['voting_auth'].append(old_fmt_data[6 * i + 5])
-
-                        self.data_store_for_13F['value'][-1] = int(
-                            self.data_store_for_13F['value'][-1].replace(',', '')
-                        ) * 1000
-                        self.data_store_for_13F['qty'][-1] = int(
-                            self.data_store_for_13F['qty'][-1].replace(',', '')
-                        )
-
-                    parsed_data['stock'] = self.data_store_for_13F['security']
-                    parsed_data['cusip'] = self.data_store_for_13F['cusip']
-                    parsed_data['mkt_val'] = self.data_store_for_13F['value']
-                    parsed_data['qty'] = self.data_store_for_13F['qty']
-
-                unique_data = parsed_data.drop_duplicates()
-                agg_parsed_data = unique_data.groupby('cusip')['value'].sum().reset_index()
-                agg_parsed_data = agg_parsed_data.sort_values(by='value',
-                                                              ascending=False,
-                                                              inplace=False).reset_index(drop=True)
-                agg_parsed_data['security'] = [
-                    unique_data.loc[
-                        unique_data['cusip'] == cusip,
-                        'security'
-                    ].values[0] for cusip in agg_parsed_data['cusip'].values
-                ]
-                return agg_parsed_data
-
-    def _parse_new_fmt(self, report_date, lines):
+            if isinstance(linkInTag, str) and '.txt' in linkInTag:
+                return self._open(self._url_head + linkInTag).decode('utf-8')
+        raise ValueError('No .txt file found in %s' % link)
+
+    @staticmethod
+    def _get_report_date(contents):
+        return contents.split('PERIOD OF REPORT:\t', 1)[1].split('\n')[0].strip()
+
+    def _parse_13F(self, contents):
+        report_date = self._get_report_date(contents)
+        new_lines = [line.replace('&amp;', '&') for line in contents.split('\n')]
+
+        # Each filing gets its own data store so that filers can be parsed concurrently
+        data_store = self._new_data_store()
+        parsed_data = self._parse_new_fmt(report_date, new_lines, data_store)
+
+        # This part where the old format is used has not been error-checked. Need to find a file with
+        # the old format in order to check this.
+        if parsed_data.empty:
+            self.logger.info('This txt file follows the old format. Parsing with old format function instead...')
+            old_fmt_data = self._parse_old_fmt(new_lines)
+            for i in range(0, len(old_fmt_data) // 6):
+                data_store['security'].append(old_fmt_data[6 * i])
+                data_store['sec_type'].append(old_fmt_data[6 * i + 1])
+                data_store['cusip'].append(old_fmt_data[6 * i + 2])
+                data_store['value'].append(old_fmt_data[6 * i + 3])
+                data_store['qty'].append(old_fmt_data[6 * i + 4])
+                data_store['voting_auth'].append(old_fmt_data[6 * i + 5])
+
+                data_store['value'][-1] = int(
+                    data_store['value'][-1].replace(',', '')
+                ) * 1000
+                data_store['qty'][-1] = int(
+                    data_store['qty'][-1].replace(',', '')
+                )
+
+            parsed_data['stock'] = data_store['security']
+            parsed_data['cusip'] = data_store['cusip']
+            parsed_data['mkt_val'] = data_store['value']
+            parsed_data['qty'] = data_store['qty']
+
+        unique_data = parsed_data.drop_duplicates()
+        agg_parsed_data = unique_data.groupby('cusip')['value'].sum().reset_index()
+        agg_parsed_data = agg_parsed_data.sort_values(by='value',
+                                                      ascending=False,
+                                                      inplace=False).reset_index(drop=True)
+        agg_parsed_data['security'] = [
+            unique_data.loc[
+                unique_data['cusip'] == cusip,
+                'security'
+            ].values[0] for cusip in agg_parsed_data['cusip'].values
+        ]
+        return agg_parsed_data
+
+    @staticmethod
+    def _parse_new_fmt(report_date, lines, data_store):
         line_num, stk_idx = 0, 0
 
         while line_num < len(lines):
@@ -217,42 +420,42 @@ class SEC:
                 while '</infoTable>' not in lines[tbl_line_num]:
                     if '<nameOfIssuer>' in lines[tbl_line_num]:
                         val1 = lines[tbl_line_num].split('<nameOfIssuer>', 1)[1].split('</nameOfIssuer>')[0]
-                        self.data_store_for_13F['security'].append(val1)
-                        self.data_store_for_13F['date'].append(report_date)
-                        self.data_store_for_13F['opt_type'].append('na')
+                        data_store['security'].append(val1)
+                        data_store['date'].append(report_date)
+                        data_store['opt_type'].append('na')
                         stk_idx += 1
 
                     if '<titleOfClass>' in lines[tbl_line_num]:
                         val1 = lines[tbl_line_num].split('<titleOfClass>', 1)[1].split('</titleOfClass>')[0]
-                        self.data_store_for_13F['title'].append(val1)
+                        data_store['title'].append(val1)
 
                     if '<cusip>' in lines[tbl_line_num]:
                         val1 = lines[tbl_line_num].split('<cusip>', 1)[1].split('</cusip>')[0]
-                        self.data_store_for_13F['cusip'].append(val1)
+                        data_store['cusip'].append(val1)
 
                     if '<value>' in lines[tbl_line_num]:
                         val1 = lines[tbl_line_num].split('<value>', 1)[1].split('</value>')[0]
-                        self.data_store_for_13F['value'].append(val1)
+                        data_store['value'].append(val1)
 
                     if '<sshPrnamt>' in lines[tbl_line_num]:
                         val1 = lines[tbl_line_num].split('<sshPrnamt>', 1)[1].split('</sshPrnamt>')[0]
-                        self.data_store_for_13F['qty'].append(val1)
+                        data_store['qty'].append(val1)
 
                     if '<putCall>' in lines[tbl_line_num]:
                         val1 = lines[tbl_line_num].split('<putCall>', 1)[1].split('</putCall>')[0]
-                        self.data_store_for_13F['security'][stk_idx - 1] += ' ' + val1
-                        self.data_store_for_13F['opt_type'][stk_idx - 1] = val1
+                        data_store['security'][stk_idx - 1] += ' ' + val1
+                        data_store['opt_type'][stk_idx - 1] = val1
 
                     tbl_line_num += 1
                 line_num = tbl_line_num
             line_num += 1
 
-        self.data_store_for_13F['value'] = [
-                int(val.replace(',', '')) * 1000 for val in self.data_store_for_13F['value']
+        data_store['value'] = [
+                int(val.replace(',', '')) * 1000 for val in data_store['value']
         ]
-        self.data_store_for_13F['sec_type'] = [np.nan] * len(self.data_store_for_13F['value'])
-        self.data_store_for_13F['voting_auth'] = [np.nan] * len(self.data_store_for_13F['value'])
-        return pd.DataFrame.from_dict(self.data_store_for_13F)
+        data_store['sec_type'] = [np.nan] * len(data_store['value'])
+        data_store['voting_auth'] = [np.nan] * len(data_store['value'])
+        return pd.DataFrame.from_dict(data_store)
 
     @staticmethod
     def _parse_old_fmt(lines):
@@ -276,12 +479,12 @@ class SEC:
 
 
 def check_guru_portfolios():
-    db = SEC()
+    db = SEC(user_agent=utils.sec_user_agent)
     db.update('13F-HR')
 
 
 def get_companies_filings_date():
-    db = SEC()
+    db = SEC(user_agent=utils.sec_user_agent)
 
     before_date = '20000430'
     doc_type = '10-'
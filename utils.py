@@ -6,3 +6,6 @@ guru_id = 2
 
 quandl_api_key = 'x6U6kqo9ac75mC9RzZ_o'
 my_path = r'C:\Users\JD\Google Drive\trading\data'
+
+# SEC requires a user agent with contact details on every request to EDGAR, so replace this with your own
+sec_user_agent = 'JD Trading jd@example.com'
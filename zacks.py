@@ -1,7 +1,10 @@
 import os
 import logging
+import datetime
+import fundamentals
 import pandas as pd
 from bs4 import BeautifulSoup
+from urllib.error import URLError
 from urllib.request import urlopen
 
 
@@ -42,3 +45,193 @@ class Zacks:
                             recommendation_details.loc[row_idx, ticker] = child.string
 
         return recommendation_details
+
+
+class ZacksRecommendations(fundamentals.Fundamentals):
+    """
+    This class keeps a history of the Zacks brokerage recommendations so that drift in analyst opinions can be
+    studied over time. Only values which changed since the previous snapshot of a ticker are written, so a daily
+    pull across the whole universe adds a handful of rows rather than a full copy of the table. The full
+    cross-section for any date is rebuilt by taking the last value of each ticker and metric on or before that date.
+    """
+    def __init__(self):
+        super(ZacksRecommendations, self).__init__()
+
+        # Define text rqd for database creation and maintenance
+        self.tbl_name = 'zacks'
+        self.keys_tbl_name = 'zacks_keys'
+        self.snapshots_tbl_name = 'zacks_snapshots'
+        self._max_tickers_per_query = 500
+
+        self._sql_cols = ['date', 'ticker', 'metric', 'value']
+        self._sql_col_dtypes = ['DATE NOT NULL', 'TEXT NOT NULL', 'TEXT NOT NULL', 'TEXT']
+        self._create_tbl_sql = 'CREATE TABLE IF NOT EXISTS ' + self.tbl_name + '(' + \
+                               ', '.join([' '.join(
+                                   [col_name, col_dtype]
+                               ) for col_name, col_dtype in zip(self._sql_cols, self._sql_col_dtypes)]) + \
+                               ', PRIMARY KEY (ticker, metric, date)) WITHOUT ROWID'
+
+        # Every (ticker, metric) pair ever stored is kept in a separate table so that the as-of query can seek the
+        # last change of each pair through the primary key, instead of scanning the whole history. The CROSS JOIN
+        # makes sqlite keep the keys table as the outer loop.
+        self._create_keys_tbl_sql = 'CREATE TABLE IF NOT EXISTS ' + self.keys_tbl_name + \
+                                    '(ticker TEXT NOT NULL, metric TEXT NOT NULL, PRIMARY KEY (ticker, metric))' + \
+                                    ' WITHOUT ROWID'
+        self._get_as_of_sql = ' '.join([
+            'SELECT z.ticker, z.metric, z.value FROM', self.keys_tbl_name, 'k CROSS JOIN', self.tbl_name, 'z',
+            'ON z.ticker=k.ticker AND z.metric=k.metric AND z.date=',
+            '(SELECT MAX(date) FROM', self.tbl_name, 'WHERE ticker=k.ticker AND metric=k.metric AND date<=?)'
+        ])
+        self._get_changes_sql = ' '.join([
+            'SELECT date, metric, value FROM', self.tbl_name, 'WHERE ticker=? ORDER BY date, metric'
+        ])
+        self._insert_change_sql = ' '.join([
+            'INSERT OR REPLACE INTO', self.tbl_name, 'VALUES', '(' + ', '.join(['?'] * len(self._sql_cols)) + ')'
+        ])
+        self._insert_key_sql = 'INSERT OR IGNORE INTO ' + self.keys_tbl_name + ' VALUES (?, ?)'
+
+        # Since unchanged values are not written, the last snapshot date of each ticker is kept separately. Storing
+        # a snapshot before it would change every later as-of cross-section, so such snapshots are rejected.
+        self._create_snapshots_tbl_sql = 'CREATE TABLE IF NOT EXISTS ' + self.snapshots_tbl_name + \
+                                         '(ticker TEXT NOT NULL PRIMARY KEY, date DATE NOT NULL) WITHOUT ROWID'
+        self._get_last_snapshot_date_sql = 'SELECT MAX(date) AS "date [DATE]" FROM ' + self.snapshots_tbl_name + \
+                                           ' WHERE ticker IN '
+        self._insert_snapshot_sql = 'INSERT OR REPLACE INTO ' + self.snapshots_tbl_name + ' VALUES (?, ?)'
+
+        # Define rqd utils for data parsing
+        self._zacks = Zacks()
+
+        # Setup logger
+        self._logger = logging.getLogger(self.tbl_name)
+
+        # Creating the database if non existent
+        self.cursor.execute(self._create_tbl_sql)
+        self.cursor.execute(self._create_keys_tbl_sql)
+        self.cursor.execute(self._create_snapshots_tbl_sql)
+
+    def update(self, tickers, snapshot_date=None):
+        if snapshot_date is None:
+            snapshot_date = datetime.datetime.today().date()
+
+        snapshot_date = self._to_date(snapshot_date)
+        tickers = list(dict.fromkeys(tickers))
+
+        # Checking for a later snapshot before downloading anything, since store would reject the snapshot anyway
+        self._check_snapshot_date(snapshot_date, tickers)
+
+        # Downloading one ticker at a time so that a delisted ticker or a bad page does not lose the whole pull.
+        # Skipped tickers are left out of the snapshot and hence keep their previous values.
+        self._logger.info('Downloading recommendations for %d tickers...' % len(tickers))
+        snapshots = []
+        for ticker in tickers:
+            try:
+                snapshots.append(self._zacks.download([ticker]))
+            except (URLError, IndexError, AttributeError) as e:
+                self._logger.warning('Skipping %s as its recommendations could not be parsed: %s' % (ticker, e))
+
+        if not snapshots:
+            self._logger.warning('No recommendations were parsed for %s.' % snapshot_date)
+            return 0
+        return self.store(snapshot_date, pd.concat(snapshots, axis=1, join='outer'))
+
+    def store(self, snapshot_date, snapshot):
+        if not isinstance(snapshot, pd.DataFrame):
+            raise NotImplementedError('Have not accounted for storing other kinds of data structures')
+        snapshot_date = self._to_date(snapshot_date)
+        tickers = list(snapshot.columns)
+        self._check_snapshot_date(snapshot_date, tickers)
+
+        # The previous state is the as-of cross-section, so a value is only written when it differs from the last
+        # one we stored for that ticker and metric. Metrics which are NaN in the snapshot, or which have been stored
+        # before but are missing from the snapshot altogether, are recorded as NULL.
+        previous = self._get_as_of_records(snapshot_date, tickers)
+        current = dict.fromkeys(previous, None)
+        for ticker in tickers:
+            for metric in snapshot.index:
+                value = snapshot.loc[metric, ticker]
+                current[(ticker, metric)] = None if pd.isnull(value) else str(value)
+
+        changes = []
+        for (ticker, metric), value in current.items():
+            if (ticker, metric) in previous:
+                if previous[(ticker, metric)] == value:
+                    continue
+            elif value is None:
+                continue
+            changes.append((snapshot_date, ticker, metric, value))
+
+        self.cursor.executemany(self._insert_change_sql, changes)
+        self.cursor.executemany(self._insert_key_sql, [change[1:3] for change in changes])
+        self.cursor.executemany(self._insert_snapshot_sql, [(ticker, snapshot_date) for ticker in tickers])
+        self._logger.info('Stored %d changed values for %s...' % (len(changes), snapshot_date))
+        return len(changes)
+
+    @staticmethod
+    def _to_date(date):
+
+        # Dates must be stored and compared as datetime.date so that sqlite sees them as 'YYYY-MM-DD' strings
+        if isinstance(date, datetime.datetime):
+            return date.date()
+        elif isinstance(date, datetime.date):
+            return date
+        else:
+            raise TypeError('Dates should be given as datetime.date or datetime.datetime.')
+
+    def _check_snapshot_date(self, snapshot_date, tickers):
+        last_snapshot_date = self._get_last_snapshot_date(tickers)
+        if last_snapshot_date is not None and snapshot_date < last_snapshot_date:
+            raise ValueError('Cannot store a snapshot for %s as some of its tickers already have a later snapshot '
+                             'on %s.' % (snapshot_date, last_snapshot_date))
+
+    def _get_last_snapshot_date(self, tickers):
+        last_snapshot_date = None
+        for i in range(0, len(tickers), self._max_tickers_per_query):
+            chunk = tickers[i:i + self._max_tickers_per_query]
+            self.cursor.execute(self._get_last_snapshot_date_sql + '(' + ', '.join(['?'] * len(chunk)) + ')', chunk)
+            date = self.cursor.fetchone()[0]
+            if date is not None and (last_snapshot_date is None or date > last_snapshot_date):
+                last_snapshot_date = date
+        return last_snapshot_date
+
+    def _get_as_of_records(self, date, tickers=None):
+        if tickers is None:
+            self.cursor.execute(self._get_as_of_sql, (date, ))
+            return {(ticker, metric): value for ticker, metric, value in self.cursor.fetchall()}
+
+        # Restricting the lookup to the given tickers in chunks to stay within sqlite's limit on parameters
+        tickers, records = list(tickers), {}
+        for i in range(0, len(tickers), self._max_tickers_per_query):
+            chunk = tickers[i:i + self._max_tickers_per_query]
+            sql = self._get_as_of_sql + ' WHERE k.ticker IN (' + ', '.join(['?'] * len(chunk)) + ')'
+            self.cursor.execute(sql, [date] + chunk)
+            records.update({(ticker, metric): value for ticker, metric, value in self.cursor.fetchall()})
+        return records
+
+    def as_of(self, date, tickers=None):
+        """
+        Returns the recommendations as they stood on the given date, in the same layout as Zacks.download,
+        i.e. metrics as rows and tickers as columns.
+        """
+        if tickers is not None:
+            tickers = set(tickers)
+        records = self._get_as_of_records(self._to_date(date), tickers)
+
+        cross_section = pd.Series(records, dtype=object)
+        cross_section = pd.DataFrame() if cross_section.empty else cross_section.unstack(level=0)
+
+        # Requested tickers are always returned as columns, even those without any stored records
+        if tickers is not None:
+            cross_section = cross_section.reindex(columns=sorted(tickers))
+        return cross_section
+
+    def traverse(self, ticker):
+        self.cursor.execute(self._get_changes_sql, (ticker, ))
+        yield from self.cursor.fetchall()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    db = ZacksRecommendations()
+    db.update(['AAPL', 'MSFT'])
+    db.conn.commit()
+    db.conn.close()